@@ -15,18 +15,152 @@ Key Features:
 - Real-time statistics with Redis backend
 """
 
+import gzip
+import hashlib
+import logging
+import threading
+import time
+from typing import NamedTuple
+
+import orjson
 from flask import Flask, jsonify, request
+from flask_compress import Compress
+from werkzeug.http import parse_accept_header
 from config import Config
-from models import StatisticsService
+from models import GovernorateNotFoundError, StatisticsService
+from cache import ResponseCache
+from json_provider import ORJSON_OPTIONS, OrjsonProvider
+from tasks import TaskRunner
 import constants
 
 # Create Flask application
 app = Flask(__name__)
+# Match routes with or without the trailing slash instead of redirecting
+app.url_map.strict_slashes = False
 app.config.from_object(Config)
+app.json = OrjsonProvider(app)
+
+# Skip per-request access logging from the Werkzeug server
+logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+class _QualityAwareCompress(Compress):
+    """Flask-Compress that never picks an encoding the client refused with q=0."""
+    
+    def _choose_compress_algorithm(self, accept_encoding_header):
+        # Flask-Compress 1.14 treats "gzip;q=0" as an acceptable encoding, so
+        # drop refused encodings before it chooses one
+        accepted = ', '.join(
+            f'{value};q={quality}'
+            for value, quality in parse_accept_header(accept_encoding_header)
+            if quality > 0
+        )
+        return super()._choose_compress_algorithm(accepted)
+
+# Compress only the views marked with @compress.compressed() (COMPRESS_REGISTER
+# is off); reference data is precompressed below and keeps its own ETag
+compress = _QualityAwareCompress(app)
 
 # Create statistics service
 stats_service = StatisticsService()
 
+# Create response cache for aggregated statistics endpoints
+response_cache = ResponseCache(stats_service.redis_client, ttl=Config.RESPONSE_CACHE_TTL)
+
+# Create background task runner for long-running operations
+task_runner = TaskRunner(stats_service.redis_client)
+
+# Redis connectivity as last observed by the health monitor
+_health_status = {'redis': 'unknown'}
+
+def _monitor_redis_health():
+    """
+    Periodically ping Redis and record the result for the health endpoint.
+    
+    Runs for the lifetime of the process in a daemon thread, which becomes a
+    greenlet under gunicorn's gevent workers.
+    """
+    while True:
+        try:
+            stats_service.redis_client.ping()
+            _health_status['redis'] = "connected"
+        except Exception as e:
+            _health_status['redis'] = f"disconnected: {str(e)}"
+        time.sleep(Config.HEALTH_CHECK_INTERVAL)
+
+threading.Thread(target=_monitor_redis_health, name='redis-health-monitor', daemon=True).start()
+
+# Reference data only changes between deploys
+REFERENCE_DATA_CACHE_CONTROL = 'public, max-age=86400, immutable'
+
+class _StaticPayload(NamedTuple):
+    """A pre-serialized reference-data body, its gzip variant and their strong ETags."""
+    body: bytes
+    etag: str
+    gzip_body: bytes
+    gzip_etag: str
+
+def _serialize_reference_data(data):
+    """
+    Serialize a reference-data list once with orjson, as the JSON provider does.
+    
+    Reference data is static for the lifetime of the process, so encoding it
+    at import time lets the reference-data views skip per-request serialization.
+    
+    Args:
+        data (list): The reference data to serialize.
+    
+    Returns:
+        _StaticPayload: The UTF-8 encoded JSON body, its gzip-compressed variant
+        and the SHA-256 ETag of each representation.
+    """
+    body = orjson.dumps(data, option=ORJSON_OPTIONS)
+    etag = hashlib.sha256(body).hexdigest()
+    return _StaticPayload(
+        body=body,
+        etag=etag,
+        gzip_body=gzip.compress(body, compresslevel=9),
+        gzip_etag=f'{etag}:gzip'
+    )
+
+def _static_endpoint(payload):
+    """
+    Build the response for a reference-data endpoint.
+    
+    Clients accepting gzip receive the precompressed body. Clients that already
+    hold the current version (matching ``If-None-Match``) receive an empty 304
+    response. Otherwise the body is handed to the WSGI server as-is through
+    ``direct_passthrough`` with its length set up front, so Werkzeug neither
+    re-encodes nor re-counts it.
+    
+    Args:
+        payload (_StaticPayload): The pre-serialized reference data.
+    
+    Returns:
+        Response: A cacheable JSON response or a 304 Not Modified response.
+    """
+    # Honour q-values so that "gzip;q=0" opts out of the gzip variant
+    use_gzip = request.accept_encodings['gzip'] > 0
+    body, etag = (payload.gzip_body, payload.gzip_etag) if use_gzip else (payload.body, payload.etag)
+    
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class([body], mimetype='application/json', direct_passthrough=True)
+        response.headers['Content-Length'] = str(len(body))
+        if use_gzip:
+            response.headers['Content-Encoding'] = 'gzip'
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = REFERENCE_DATA_CACHE_CONTROL
+    response.vary.add('Accept-Encoding')
+    return response
+
+# Pre-serialized reference data
+_GOVERNORATES_DATA = _serialize_reference_data(constants.GOVERNORATES)
+_PARTIES_DATA = _serialize_reference_data(constants.POLITICAL_PARTIES)
+_USER_TYPES_DATA = _serialize_reference_data(constants.USER_TYPES)
+_COUNCILS_DATA = _serialize_reference_data(constants.COUNCIL_TYPES)
+_COMPLAINT_CATEGORIES_DATA = _serialize_reference_data(constants.COMPLAINT_CATEGORIES)
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """
@@ -36,26 +170,24 @@ def health_check():
     and service version information. It's used by load balancers and monitoring
     systems to verify service availability.
     
+    The Redis status is the one last observed by the background health monitor,
+    so frequent probes never wait on a Redis round-trip.
+    
     Returns:
         JSON response with service health information including:
         - Service status and version
         - Redis connectivity status
     """
-    try:
-        # Test Redis connection
-        stats_service.redis_client.ping()
-        redis_status = "connected"
-    except Exception as e:
-        redis_status = f"disconnected: {str(e)}"
-    
     return jsonify({
         "status": "ok",
         "service": "naebak-statistics-service",
         "version": "1.0.0",
-        "redis_status": redis_status
+        "redis_status": _health_status['redis']
     }), 200
 
 @app.route('/api/statistics/overall/', methods=['GET'])
+@compress.compressed()
+@response_cache.cached
 def get_overall_statistics():
     """
     Retrieve comprehensive platform-wide statistics.
@@ -77,13 +209,11 @@ def get_overall_statistics():
         - Service effectiveness through complaint resolution
         - Political participation through candidate/member counts
     """
-    try:
-        stats = stats_service.get_overall_statistics()
-        return jsonify(stats.to_dict()), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    # orjson encodes the dataclass fields directly, without a to_dict() copy
+    return jsonify(stats_service.get_overall_statistics()), 200
 
 @app.route('/api/statistics/governorate/<governorate_code>/', methods=['GET'])
+@compress.compressed()
 def get_governorate_statistics(governorate_code):
     """
     Retrieve statistics for a specific governorate.
@@ -107,23 +237,19 @@ def get_governorate_statistics(governorate_code):
         - Complaint patterns for identifying regional issues
         - Communication activity for engagement measurement
     """
-    try:
-        stats = stats_service.get_governorate_statistics(governorate_code)
-        return jsonify({
-            "governorate_code": stats.governorate_code,
-            "governorate_name": stats.governorate_name,
-            "users_count": stats.users_count,
-            "complaints_count": stats.complaints_count,
-            "messages_count": stats.messages_count,
-            "complaints_per_user": round(stats.get_complaints_per_user(), 2),
-            "activity_score": round(stats.get_activity_score(), 2)
-        }), 200
-    except ValueError as e:
-        return jsonify({"error": str(e)}), 404
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    stats = stats_service.get_governorate_statistics(governorate_code)
+    return jsonify({
+        "governorate_code": stats.governorate_code,
+        "governorate_name": stats.governorate_name,
+        "users_count": stats.users_count,
+        "complaints_count": stats.complaints_count,
+        "messages_count": stats.messages_count,
+        "complaints_per_user": round(stats.get_complaints_per_user(), 2),
+        "activity_score": round(stats.get_activity_score(), 2)
+    }), 200
 
 @app.route('/api/statistics/party/<party_name>/', methods=['GET'])
+@compress.compressed()
 def get_party_statistics(party_name):
     """
     Retrieve statistics for a specific political party.
@@ -147,20 +273,19 @@ def get_party_statistics(party_name):
         - Public perception through average ratings
         - Political engagement and participation metrics
     """
-    try:
-        stats = stats_service.get_party_statistics(party_name)
-        return jsonify({
-            "party_name": stats.party_name,
-            "candidates_count": stats.candidates_count,
-            "members_count": stats.members_count,
-            "ratings_average": round(stats.ratings_average, 2),
-            "total_representation": stats.get_total_representation(),
-            "rating_category": stats.get_rating_category()
-        }), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    stats = stats_service.get_party_statistics(party_name)
+    return jsonify({
+        "party_name": stats.party_name,
+        "candidates_count": stats.candidates_count,
+        "members_count": stats.members_count,
+        "ratings_average": stats.ratings_average,
+        "total_representation": stats.get_total_representation(),
+        "rating_category": stats.get_rating_category()
+    }), 200
 
 @app.route('/api/statistics/governorates/all/', methods=['GET'])
+@compress.compressed()
+@response_cache.cached
 def get_all_governorates_statistics():
     """
     Retrieve statistics for all governorates.
@@ -172,23 +297,28 @@ def get_all_governorates_statistics():
     Returns:
         JSON array with statistics for all governorates, sorted by activity level.
     """
-    try:
-        all_stats = stats_service.get_all_governorate_statistics()
-        # Sort by activity score for better insights
-        all_stats.sort(key=lambda x: x.get_activity_score(), reverse=True)
-        
-        return jsonify([{
-            "governorate_code": stats.governorate_code,
-            "governorate_name": stats.governorate_name,
-            "users_count": stats.users_count,
-            "complaints_count": stats.complaints_count,
-            "messages_count": stats.messages_count,
-            "activity_score": round(stats.get_activity_score(), 2)
-        } for stats in all_stats]), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    all_stats = stats_service.get_all_governorate_statistics()
+    # Compute each activity score once and reuse it for sorting and output
+    scored = [(stats.get_activity_score(), stats) for stats in all_stats]
+    scored.sort(key=lambda item: item[0], reverse=True)
+    
+    return jsonify([{
+        "governorate_code": stats.governorate_code,
+        "governorate_name": stats.governorate_name,
+        "users_count": stats.users_count,
+        "complaints_count": stats.complaints_count,
+        "messages_count": stats.messages_count,
+        "activity_score": round(score, 2)
+    } for score, stats in scored]), 200
+
+def _top_parties_limit():
+    """Return the requested number of top parties, clamped to the allowed range."""
+    limit = request.args.get('limit', constants.TOP_PARTIES_DEFAULT_LIMIT, type=int)
+    return min(max(limit, 1), constants.TOP_PARTIES_MAX_LIMIT)
 
 @app.route('/api/statistics/parties/top/', methods=['GET'])
+@compress.compressed()
+@response_cache.cached(vary_on=lambda: {'limit': _top_parties_limit()})
 def get_top_parties_statistics():
     """
     Retrieve statistics for top political parties by representation.
@@ -198,24 +328,21 @@ def get_top_parties_statistics():
     
     Query Parameters:
         limit (int, optional): Maximum number of parties to return (default: 10).
+            Values are clamped to the range 1-50.
     
     Returns:
         JSON array with top parties sorted by total representation.
     """
-    try:
-        limit = request.args.get('limit', 10, type=int)
-        top_parties = stats_service.get_top_parties_by_representation(limit)
-        
-        return jsonify([{
-            "party_name": stats.party_name,
-            "candidates_count": stats.candidates_count,
-            "members_count": stats.members_count,
-            "total_representation": stats.get_total_representation(),
-            "ratings_average": round(stats.ratings_average, 2),
-            "rating_category": stats.get_rating_category()
-        } for stats in top_parties]), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    top_parties = stats_service.get_top_parties_by_representation(_top_parties_limit())
+    
+    return jsonify([{
+        "party_name": stats.party_name,
+        "candidates_count": stats.candidates_count,
+        "members_count": stats.members_count,
+        "total_representation": stats.get_total_representation(),
+        "ratings_average": stats.ratings_average,
+        "rating_category": stats.get_rating_category()
+    } for stats in top_parties]), 200
 
 @app.route('/api/statistics/data/governorates/', methods=['GET'])
 def get_governorates_data():
@@ -229,7 +356,7 @@ def get_governorates_data():
     Returns:
         JSON array with governorate reference data.
     """
-    return jsonify(constants.GOVERNORATES), 200
+    return _static_endpoint(_GOVERNORATES_DATA)
 
 @app.route('/api/statistics/data/parties/', methods=['GET'])
 def get_parties_data():
@@ -243,7 +370,7 @@ def get_parties_data():
     Returns:
         JSON array with political party reference data.
     """
-    return jsonify(constants.POLITICAL_PARTIES), 200
+    return _static_endpoint(_PARTIES_DATA)
 
 @app.route('/api/statistics/data/user-types/', methods=['GET'])
 def get_user_types_data():
@@ -257,7 +384,7 @@ def get_user_types_data():
     Returns:
         JSON array with user type reference data.
     """
-    return jsonify(constants.USER_TYPES), 200
+    return _static_endpoint(_USER_TYPES_DATA)
 
 @app.route('/api/statistics/data/councils/', methods=['GET'])
 def get_councils_data():
@@ -270,7 +397,7 @@ def get_councils_data():
     Returns:
         JSON array with council type reference data.
     """
-    return jsonify(constants.COUNCIL_TYPES), 200
+    return _static_endpoint(_COUNCILS_DATA)
 
 @app.route('/api/statistics/data/complaint-categories/', methods=['GET'])
 def get_complaint_categories_data():
@@ -284,9 +411,11 @@ def get_complaint_categories_data():
     Returns:
         JSON array with complaint category reference data.
     """
-    return jsonify(constants.COMPLAINT_CATEGORIES), 200
+    return _static_endpoint(_COMPLAINT_CATEGORIES_DATA)
 
 @app.route('/api/statistics/summary/', methods=['GET'])
+@compress.compressed()
+@response_cache.cached
 def get_statistics_summary():
     """
     Retrieve a summary of key platform metrics.
@@ -298,22 +427,19 @@ def get_statistics_summary():
         JSON response with key summary metrics including engagement rates
         and resolution statistics.
     """
-    try:
-        stats = stats_service.get_overall_statistics()
-        
-        return jsonify({
-            "total_users": stats.total_users,
-            "total_complaints": stats.total_complaints,
-            "complaint_resolution_rate": round(stats.get_complaint_resolution_rate(), 1),
-            "user_engagement_score": round(stats.get_user_engagement_score(), 1),
-            "active_candidates": stats.total_candidates,
-            "platform_activity": {
-                "messages": stats.total_messages,
-                "ratings": stats.total_ratings
-            }
-        }), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    stats = stats_service.get_overall_statistics()
+    
+    return jsonify({
+        "total_users": stats.total_users,
+        "total_complaints": stats.total_complaints,
+        "complaint_resolution_rate": round(stats.get_complaint_resolution_rate(), 1),
+        "user_engagement_score": round(stats.get_user_engagement_score(), 1),
+        "active_candidates": stats.total_candidates,
+        "platform_activity": {
+            "messages": stats.total_messages,
+            "ratings": stats.total_ratings
+        }
+    }), 200
 
 @app.route('/api/statistics/initialize/', methods=['POST'])
 def initialize_default_data():
@@ -322,21 +448,46 @@ def initialize_default_data():
     
     This endpoint sets up realistic sample data when the service is first
     deployed, providing immediate visual feedback for dashboards and
-    testing capabilities for development environments.
+    testing capabilities for development environments. The seeding runs
+    in the background so the request returns immediately.
     
     Returns:
-        JSON response confirming successful data initialization.
+        JSON response with the identifier of the queued initialization task
+        and HTTP 202 Accepted.
         
     Security Note:
         This endpoint should be protected or disabled in production environments.
     """
-    try:
-        stats_service.initialize_default_data()
-        return jsonify({"message": "تم تهيئة البيانات الافتراضية بنجاح"}), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    task_id = task_runner.submit('initialize', stats_service.initialize_default_data)
+    return jsonify({"task_id": task_id, "status": "queued"}), 202
+
+@app.route('/api/statistics/initialize/<task_id>/status/', methods=['GET'])
+def get_initialization_status(task_id):
+    """
+    Retrieve the status of a default data initialization task.
+    
+    Args:
+        task_id (str): The task identifier returned by the initialize endpoint.
+    
+    Returns:
+        JSON response with the task status (queued, running, completed or
+        failed) and, for failed tasks, the error message.
+    """
+    task_status = task_runner.get_status('initialize', task_id)
+    if task_status is None:
+        return jsonify({"error": f"Task not found: {task_id}"}), 404
+    
+    response = {"task_id": task_id, **task_status}
+    if task_status['status'] == 'completed':
+        response["message"] = "تم تهيئة البيانات الافتراضية بنجاح"
+    return jsonify(response), 200
 
 # Error handlers
+@app.errorhandler(GovernorateNotFoundError)
+def governorate_not_found(error):
+    """Handle lookups of unknown governorate codes as 404 Not Found."""
+    return jsonify({"error": str(error)}), 404
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 Not Found errors."""
@@ -344,10 +495,23 @@ def not_found(error):
 
 @app.errorhandler(500)
 def internal_error(error):
-    """Handle 500 Internal Server errors."""
+    """
+    Handle 500 Internal Server errors.
+    
+    Flask logs unhandled view exceptions and passes them here wrapped in an
+    InternalServerError; their message is reported as the error.
+    """
+    if error.original_exception is not None:
+        return jsonify({"error": str(error.original_exception)}), 500
     return jsonify({"error": "خطأ داخلي في الخادم"}), 500
 
 if __name__ == '__main__':
+    # The built-in server is for development only; production traffic is
+    # served by gunicorn with gevent workers (see gunicorn_conf.py)
+    if app.config['FLASK_ENV'] != 'development':
+        print("❌ Run the service with: gunicorn -c gunicorn_conf.py app:app")
+        raise SystemExit(1)
+    
     # Initialize default data on startup for testing
     try:
         stats_service.initialize_default_data()
@@ -355,9 +519,9 @@ if __name__ == '__main__':
     except Exception as e:
         print(f"❌ Error initializing data: {e}")
     
-    # Run the application
+    # Run the development server
     app.run(
         host='0.0.0.0', 
         port=app.config['PORT'], 
-        debug=app.config['FLASK_ENV'] == 'development'
+        debug=True
     )
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Response Cache - Naebak Statistics Service
+
+This module provides a Redis-backed cache for the aggregated statistics endpoints.
+Dashboards poll these endpoints frequently while the underlying counters change
+slowly, so serving a recently generated JSON body avoids re-running the Redis
+fan-out and Python-side aggregation on every request.
+"""
+
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlencode
+
+import redis
+from flask import current_app, make_response, request
+
+
+class ResponseCache:
+    """
+    Redis-backed cache for JSON responses of read-only endpoints.
+    
+    Each cached response is stored as a Redis hash under
+    ``cache:resp:<endpoint>`` or, for views that declare the parameters their
+    response depends on, ``cache:resp:<endpoint>:<params>``. Keys are built
+    from the normalized parameter values rather than the raw query string,
+    so equivalent or unrelated query strings (for example ``?limit=999`` and
+    ``?limit=50``, or a ``?_=<timestamp>`` cache-buster) share one entry.
+    The last successful body of every key is also kept in process memory and
+    served as a stale fallback when Redis or the underlying handler fails;
+    such responses carry an ``X-Cache: STALE`` header and the failure is logged.
+    
+    Attributes:
+        redis_client: Redis client used to store cached responses.
+        ttl (int): Number of seconds a cached response stays fresh.
+    
+    Hash Fields:
+        - body: The JSON response body
+        - status: The HTTP status code
+        - generated_at: Unix timestamp when the body was generated
+        - stale_at: Unix timestamp after which the body is considered stale
+    """
+    
+    KEY_PREFIX = 'cache:resp'
+    MAX_STALE_ENTRIES = 256
+    
+    def __init__(self, redis_client, ttl: int = 10):
+        """
+        Initialize the response cache.
+        
+        Args:
+            redis_client: Redis client used to store cached responses.
+            ttl (int): Number of seconds a cached response stays fresh (default: 10).
+        """
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self._last_known = {}
+    
+    def cached(self, view=None, *, vary_on: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        Decorate a view so that its successful responses are cached in Redis.
+        
+        Usable as ``@response_cache.cached`` or
+        ``@response_cache.cached(vary_on=...)``.
+        
+        Args:
+            view: The Flask view function to wrap.
+            vary_on (Optional[Callable[[], Dict[str, Any]]]): Returns the
+                normalized request parameters the response depends on. Views
+                without it are cached under a single key per endpoint.
+        
+        Returns:
+            The wrapped view function.
+        """
+        if view is None:
+            return lambda view: self.cached(view, vary_on=vary_on)
+        
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = self._make_key(vary_on() if vary_on else None)
+            
+            try:
+                entry = self.redis_client.hgetall(key)
+            except redis.RedisError:
+                entry = None
+            if entry:
+                return self._build_response(entry['body'], int(entry['status']))
+            
+            try:
+                response = make_response(view(*args, **kwargs))
+            except Exception:
+                # Serve the last known body rather than an error
+                stale = self._last_known.get(key)
+                if stale is None:
+                    raise
+                current_app.logger.exception(
+                    "Serving stale response for %s after view error", request.endpoint
+                )
+                response = self._build_response(*stale)
+                response.headers['X-Cache'] = 'STALE'
+                return response
+            
+            if response.status_code == 200:
+                self._store(key, response)
+            return response
+        
+        return wrapper
+    
+    def _make_key(self, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for the current request.
+        
+        Args:
+            params (Optional[Dict[str, Any]]): The normalized request parameters
+                the response depends on.
+        
+        Returns:
+            str: Cache key derived from the endpoint and the given parameters.
+        """
+        key = f'{self.KEY_PREFIX}:{request.endpoint}'
+        if params:
+            key = f'{key}:{urlencode(sorted(params.items()))}'
+        return key
+    
+    def _build_response(self, body: str, status: int):
+        """Build a JSON response from a cached body."""
+        return current_app.response_class(body, status=status, mimetype='application/json')
+    
+    def _store(self, key: str, response):
+        """
+        Store a successful response in Redis and in the stale fallback map.
+        
+        Args:
+            key (str): The cache key for the response.
+            response: The Flask response to cache.
+        """
+        body = response.get_data(as_text=True)
+        generated_at = time.time()
+        
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hset(key, mapping={
+            'body': body,
+            'status': response.status_code,
+            'generated_at': generated_at,
+            'stale_at': generated_at + self.ttl
+        })
+        pipe.expire(key, self.ttl)
+        try:
+            pipe.execute()
+        except redis.RedisError:
+            # Caching is best-effort; the response itself is still valid
+            pass
+        
+        if key in self._last_known or len(self._last_known) < self.MAX_STALE_ENTRIES:
+            self._last_known[key] = (body, response.status_code)
@@ -12,12 +12,22 @@ class Config:
     
     # إعدادات Flask
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key')
+    FLASK_ENV = os.environ.get('FLASK_ENV', 'production')
     
     # إعدادات Redis
     REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+    REDIS_MAX_CONNECTIONS = int(os.environ.get('REDIS_MAX_CONNECTIONS', 512))
     
     # إعدادات الخدمة
     PORT = int(os.environ.get('PORT', 8012))
+    HEALTH_CHECK_INTERVAL = int(os.environ.get('HEALTH_CHECK_INTERVAL', 5))
     STATS_RETENTION_DAYS = int(os.environ.get('STATS_RETENTION_DAYS', 90))
     REAL_TIME_ENABLED = os.environ.get('REAL_TIME_ENABLED', 'true').lower() == 'true'
     AGGREGATION_INTERVAL = int(os.environ.get('AGGREGATION_INTERVAL', 300))
+    RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', 10))
+    STATS_CACHE_TTL = int(os.environ.get('STATS_CACHE_TTL', 1))
+    
+    # إعدادات ضغط الاستجابات
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 500))
+    # الضغط يُطبّق فقط على مسارات الإحصائيات المحددة، أما البيانات المرجعية فمضغوطة مسبقاً
+    COMPRESS_REGISTER = False
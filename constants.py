@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """ثوابت وبيانات أساسية لخدمة الإحصائيات"""
 
+from types import SimpleNamespace
+
 # مفاتيح Redis للإحصائيات الأساسية
 REDIS_KEYS = {
     'TOTAL_USERS': 'stats:total_users',
@@ -14,6 +16,12 @@ REDIS_KEYS = {
     'PENDING_COMPLAINTS': 'stats:pending_complaints',
 }
 
+# وصول مباشر للمفاتيح عبر الخصائص (REDIS_KEY.TOTAL_USERS)
+REDIS_KEY = SimpleNamespace(**REDIS_KEYS)
+
+# مفاتيح الإحصائيات الإجمالية بنفس ترتيب حقول StatisticsData
+OVERALL_KEYS = tuple(REDIS_KEYS.values())
+
 # المحافظات المصرية (27 محافظة)
 GOVERNORATES = [
     {"name": "القاهرة", "name_en": "Cairo", "code": "CAI"},
@@ -45,6 +53,9 @@ GOVERNORATES = [
     {"name": "قنا", "name_en": "Qena", "code": "QEN"}
 ]
 
+# فهرس المحافظات حسب الكود
+GOVERNORATES_BY_CODE = {g["code"]: g for g in GOVERNORATES}
+
 # الأحزاب السياسية المصرية
 POLITICAL_PARTIES = [
     {"name": "حزب الوفد", "name_en": "Al-Wafd Party", "abbreviation": "الوفد"},
@@ -65,6 +76,13 @@ POLITICAL_PARTIES = [
     {"name": "مستقل", "name_en": "Independent", "abbreviation": "مستقل"}
 ]
 
+# فهرس الأحزاب حسب الاسم
+PARTIES_BY_NAME = {p["name"]: p for p in POLITICAL_PARTIES}
+
+# حدود عدد الأحزاب في قائمة الأكثر تمثيلاً
+TOP_PARTIES_DEFAULT_LIMIT = 10
+TOP_PARTIES_MAX_LIMIT = 50
+
 # أنواع المستخدمين
 USER_TYPES = [
     {
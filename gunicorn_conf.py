@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""إعدادات Gunicorn لخدمة الإحصائيات"""
+
+import multiprocessing
+import os
+
+# نقطة دخول التطبيق الوحيدة
+wsgi_app = 'app:app'
+
+# عنوان الخادم
+bind = f"0.0.0.0:{os.environ.get('PORT', 8012)}"
+
+# عمال gevent لأن جميع الطلبات تنتظر ردود Redis
+worker_class = 'gevent'
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 2000))
+
+# تحميل التطبيق داخل كل عامل بعد التفرع حتى ينشئ كل عامل مجمع اتصالات Redis
+# وخيط مراقبة الصحة الخاصين به (الخيوط لا تنتقل عبر fork)
+preload_app = False
+
+# إعادة تشغيل العمال دورياً لتفادي تراكم الذاكرة
+max_requests = 500
+max_requests_jitter = 200
+
+# السجلات - سجل الوصول معطل افتراضياً ويُفعّل بتحديد GUNICORN_ACCESS_LOG (مثلاً "-")
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'warning')
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG')
+# صيغة نصية على نمط Apache وليست JSON، لأن gunicorn لا يهرّب محتوى سطر الطلب
+access_log_format = '%(h)s "%(r)s" %(s)s %(B)s %(D)sus'
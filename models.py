@@ -7,15 +7,72 @@ It includes models for platform-wide statistics, governorate-specific analytics,
 party metrics. The service provides comprehensive insights into platform usage and engagement.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Callable, Hashable, Optional, Sequence, Tuple
+import bisect
+import functools
+import heapq
+import operator
+import socket
+import threading
 import redis
+from cachetools import TTLCache
 from config import Config
+from constants import (
+    GOVERNORATES, GOVERNORATES_BY_CODE, OVERALL_KEYS, PARTIES_BY_NAME, POLITICAL_PARTIES,
+    REDIS_KEY
+)
 
-# Setup Redis connection
-redis_client = redis.from_url(Config.REDIS_URL, decode_responses=True)
+# TCP keepalive probes so idle pooled connections are not silently dropped
+# (only the options supported by the current platform are applied)
+REDIS_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 30), ('TCP_KEEPCNT', 3))
+    if hasattr(socket, name)
+}
 
-@dataclass
+# Setup Redis connection pool shared by every request in the worker process;
+# when all connections are busy, requests wait for one instead of failing.
+# Replies are parsed by hiredis when it is installed, which also decodes them
+# to str in C, so decode_responses adds no Python-level cost to counter reads.
+# Counters are read with `int(value or 0)` because keys that were never
+# incremented do not exist in Redis.
+# The pool is created when each gunicorn worker imports the app (preload_app
+# is off), and redis-py discards inherited connections if it detects a fork.
+redis_pool = redis.BlockingConnectionPool.from_url(
+    Config.REDIS_URL,
+    decode_responses=True,
+    max_connections=Config.REDIS_MAX_CONNECTIONS,
+    socket_keepalive=True,
+    socket_keepalive_options=REDIS_KEEPALIVE_OPTIONS,
+    health_check_interval=30
+)
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# Every statistics counter lives under this prefix (response cache and task
+# status keys use their own prefixes)
+STATS_KEY_PATTERN = 'stats:*'
+
+# Increments every KEYS[i] by ARGV[i] atomically in a single round-trip
+BULK_INCREMENT_SCRIPT = """
+for i = 1, #KEYS do
+    redis.call('INCRBY', KEYS[i], ARGV[i])
+end
+"""
+
+def _with_field_getter(cls):
+    """
+    Attach the dataclass field names and a matching attrgetter to a class.
+    
+    to_dict() zips these together, so every field is read in one C-level call
+    and the key list always follows the field declarations.
+    """
+    cls._FIELDS = tuple(f.name for f in fields(cls))
+    cls._GET_FIELDS = operator.attrgetter(*cls._FIELDS)
+    return cls
+
+@_with_field_getter
+@dataclass(slots=True)
 class StatisticsData:
     """
     Represents comprehensive platform-wide statistics.
@@ -58,17 +115,7 @@ class StatisticsData:
         Returns:
             Dict[str, Any]: A dictionary representation of the platform statistics.
         """
-        return {
-            'total_users': self.total_users,
-            'total_citizens': self.total_citizens,
-            'total_candidates': self.total_candidates,
-            'total_members': self.total_members,
-            'total_messages': self.total_messages,
-            'total_complaints': self.total_complaints,
-            'total_ratings': self.total_ratings,
-            'resolved_complaints': self.resolved_complaints,
-            'pending_complaints': self.pending_complaints
-        }
+        return dict(zip(self._FIELDS, self._GET_FIELDS(self)))
     
     def get_complaint_resolution_rate(self) -> float:
         """
@@ -92,7 +139,8 @@ class StatisticsData:
             return 0.0
         return (self.total_messages + self.total_ratings) / self.total_users
 
-@dataclass
+@_with_field_getter
+@dataclass(slots=True)
 class GovernorateStats:
     """
     Represents statistics for a specific governorate.
@@ -126,13 +174,7 @@ class GovernorateStats:
         Returns:
             Dict[str, Any]: A dictionary representation of the governorate statistics.
         """
-        return {
-            'governorate_code': self.governorate_code,
-            'governorate_name': self.governorate_name,
-            'users_count': self.users_count,
-            'complaints_count': self.complaints_count,
-            'messages_count': self.messages_count
-        }
+        return dict(zip(self._FIELDS, self._GET_FIELDS(self)))
     
     def get_complaints_per_user(self) -> float:
         """
@@ -156,7 +198,12 @@ class GovernorateStats:
             return 0.0
         return (self.messages_count + self.complaints_count) / self.users_count
 
-@dataclass
+# Lower bounds of the average, good and excellent rating categories
+_RATING_THRESHOLDS = (2.5, 3.5, 4.5)
+_RATING_CATEGORIES = ('poor', 'average', 'good', 'excellent')
+
+@_with_field_getter
+@dataclass(slots=True)
 class PartyStats:
     """
     Represents statistics for a specific political party.
@@ -169,7 +216,8 @@ class PartyStats:
         party_name (str): Name of the political party.
         candidates_count (int): Number of candidates affiliated with this party.
         members_count (int): Number of registered party members.
-        ratings_average (float): Average rating received by party candidates/members.
+        ratings_average (float): Average rating received by party candidates/members,
+            rounded to two decimals when loaded from Redis.
     
     Political Analytics:
         - Party representation through candidate and member counts
@@ -188,12 +236,7 @@ class PartyStats:
         Returns:
             Dict[str, Any]: A dictionary representation of the party statistics.
         """
-        return {
-            'party_name': self.party_name,
-            'candidates_count': self.candidates_count,
-            'members_count': self.members_count,
-            'ratings_average': round(self.ratings_average, 2)
-        }
+        return dict(zip(self._FIELDS, self._GET_FIELDS(self)))
     
     def get_total_representation(self) -> int:
         """
@@ -211,14 +254,47 @@ class PartyStats:
         Returns:
             str: Rating category (excellent, good, average, poor).
         """
-        if self.ratings_average >= 4.5:
-            return "excellent"
-        elif self.ratings_average >= 3.5:
-            return "good"
-        elif self.ratings_average >= 2.5:
-            return "average"
-        else:
-            return "poor"
+        # bisect_right puts a rating equal to a threshold in the higher category
+        return _RATING_CATEGORIES[bisect.bisect_right(_RATING_THRESHOLDS, self.ratings_average)]
+
+def _governorate_keys(governorate_code: str) -> Tuple[str, str, str]:
+    """
+    Build the Redis keys holding a governorate's counters.
+    
+    Returns:
+        Tuple[str, str, str]: The users, complaints and messages keys.
+    """
+    return (
+        f'stats:gov:{governorate_code}:users',
+        f'stats:gov:{governorate_code}:complaints',
+        f'stats:gov:{governorate_code}:messages'
+    )
+
+@functools.lru_cache(maxsize=512)
+def _party_keys(party_name: str) -> Tuple[str, str, str, str]:
+    """
+    Build the Redis keys holding a political party's counters.
+    
+    Returns:
+        Tuple[str, str, str, str]: The candidates, members, ratings sum and
+        ratings count keys.
+    """
+    return (
+        f'stats:party:{party_name}:candidates',
+        f'stats:party:{party_name}:members',
+        f'stats:party:{party_name}:ratings_sum',
+        f'stats:party:{party_name}:ratings_count'
+    )
+
+# Keys of every known governorate, built once instead of on every request
+_GOVERNORATE_KEYS = {governorate['code']: _governorate_keys(governorate['code']) for governorate in GOVERNORATES}
+
+# Keys of every governorate and party, in reference-data order, for bulk reads
+_ALL_GOVERNORATE_KEYS = tuple(key for governorate in GOVERNORATES for key in _GOVERNORATE_KEYS[governorate['code']])
+_ALL_PARTY_KEYS = tuple(key for party in POLITICAL_PARTIES for key in _party_keys(party['name']))
+
+class GovernorateNotFoundError(ValueError):
+    """Raised when statistics are requested for an unknown governorate code."""
 
 class StatisticsService:
     """
@@ -243,13 +319,84 @@ class StatisticsService:
         - All counters are stored in Redis for fast access
         - Atomic operations ensure data consistency
         - Efficient key naming for organized data structure
+        - Read results are kept in a short-lived in-process cache
     """
     
-    def __init__(self):
+    # One in-process cache entry for the overall and all-governorates reads,
+    # plus one per known governorate and party
+    CACHE_MAX_SIZE = 2 + len(GOVERNORATES_BY_CODE) + len(PARTIES_BY_NAME)
+    
+    def __init__(self, cache_ttl: float = Config.STATS_CACHE_TTL):
         """
         Initialize the statistics service with Redis connection.
+        
+        Args:
+            cache_ttl (float): Seconds that read results stay in the in-process
+                cache (default: STATS_CACHE_TTL).
         """
         self.redis_client = redis_client
+        self._cache = TTLCache(maxsize=self.CACHE_MAX_SIZE, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+        # Runs via EVALSHA and reloads the script if Redis has lost it
+        self._bulk_increment_script = self.redis_client.register_script(BULK_INCREMENT_SCRIPT)
+    
+    def _cache_get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return a value from the in-process cache, or None if it is missing or expired.
+        
+        Args:
+            key (Hashable): The cache key.
+        """
+        with self._cache_lock:
+            return self._cache.get(key)
+    
+    def _cache_set(self, key: Hashable, value: Any):
+        """
+        Store a value in the in-process cache.
+        
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+        """
+        with self._cache_lock:
+            self._cache[key] = value
+    
+    def _get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return a cached value, loading and caching it on a miss.
+        
+        Each entry has its own load lock, so concurrent requests for the same
+        entry wait for the first load instead of all hitting Redis, while
+        misses on other entries load independently.
+        
+        Args:
+            key (Hashable): The cache key.
+            loader (Callable[[], Any]): Loads the value from Redis.
+        
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        value = self._cache_get(key)
+        if value is None:
+            with self._cache_lock:
+                load_lock = self._load_locks.setdefault(key, threading.Lock())
+            with load_lock:
+                value = self._cache_get(key)
+                if value is None:
+                    value = loader()
+                    self._cache_set(key, value)
+        return value
+    
+    def invalidate(self):
+        """
+        Drop every entry from the in-process cache.
+        
+        Called after writes so that subsequent reads see the updated counters.
+        Cached endpoint responses are not touched and expire after their TTL.
+        """
+        with self._cache_lock:
+            self._cache.clear()
     
     def get_overall_statistics(self) -> StatisticsData:
         """
@@ -262,20 +409,13 @@ class StatisticsService:
             StatisticsData: Complete platform statistics including user counts,
             activity metrics, and complaint resolution data.
         """
-        stats = StatisticsData()
-        
-        # Retrieve all statistics from Redis
-        stats.total_users = int(self.redis_client.get('stats:total_users') or 0)
-        stats.total_citizens = int(self.redis_client.get('stats:total_citizens') or 0)
-        stats.total_candidates = int(self.redis_client.get('stats:total_candidates') or 0)
-        stats.total_members = int(self.redis_client.get('stats:total_members') or 0)
-        stats.total_messages = int(self.redis_client.get('stats:total_messages') or 0)
-        stats.total_complaints = int(self.redis_client.get('stats:total_complaints') or 0)
-        stats.total_ratings = int(self.redis_client.get('stats:total_ratings') or 0)
-        stats.resolved_complaints = int(self.redis_client.get('stats:resolved_complaints') or 0)
-        stats.pending_complaints = int(self.redis_client.get('stats:pending_complaints') or 0)
-        
-        return stats
+        return self._get_or_load(('overall',), self._fetch_overall_statistics)
+    
+    def _fetch_overall_statistics(self) -> StatisticsData:
+        """Read the platform-wide counters from Redis."""
+        # Fetch all counters in a single round-trip; OVERALL_KEYS follows the field order
+        values = self.redis_client.mget(OVERALL_KEYS)
+        return StatisticsData(*[int(value or 0) for value in values])
     
     def get_governorate_statistics(self, governorate_code: str) -> GovernorateStats:
         """
@@ -291,26 +431,20 @@ class StatisticsService:
             GovernorateStats: Statistics specific to the requested governorate.
             
         Raises:
-            ValueError: If the governorate code is not found in the system.
+            GovernorateNotFoundError: If the governorate code is not found in the system.
         """
-        from constants import GOVERNORATES
-        
         # Find the governorate in the constants
-        governorate = next((g for g in GOVERNORATES if g['code'] == governorate_code), None)
+        governorate = GOVERNORATES_BY_CODE.get(governorate_code)
         if not governorate:
-            raise ValueError(f"Governorate not found: {governorate_code}")
-        
-        stats = GovernorateStats(
-            governorate_code=governorate_code,
-            governorate_name=governorate['name']
-        )
+            raise GovernorateNotFoundError(f"Governorate not found: {governorate_code}")
         
         # Retrieve governorate-specific statistics from Redis
-        stats.users_count = int(self.redis_client.get(f'stats:gov:{governorate_code}:users') or 0)
-        stats.complaints_count = int(self.redis_client.get(f'stats:gov:{governorate_code}:complaints') or 0)
-        stats.messages_count = int(self.redis_client.get(f'stats:gov:{governorate_code}:messages') or 0)
-        
-        return stats
+        return self._get_or_load(
+            ('governorate', governorate_code),
+            lambda: self._build_governorate_stats(
+                governorate, self.redis_client.mget(_GOVERNORATE_KEYS[governorate_code])
+            )
+        )
     
     def get_party_statistics(self, party_name: str) -> PartyStats:
         """
@@ -325,18 +459,62 @@ class StatisticsService:
         Returns:
             PartyStats: Statistics specific to the requested political party.
         """
-        stats = PartyStats(party_name=party_name)
-        
         # Retrieve party-specific statistics from Redis
-        stats.candidates_count = int(self.redis_client.get(f'stats:party:{party_name}:candidates') or 0)
-        stats.members_count = int(self.redis_client.get(f'stats:party:{party_name}:members') or 0)
+        def load() -> PartyStats:
+            return self._build_party_stats(party_name, self.redis_client.mget(_party_keys(party_name)))
         
-        # Calculate average ratings
-        ratings_sum = float(self.redis_client.get(f'stats:party:{party_name}:ratings_sum') or 0)
-        ratings_count = int(self.redis_client.get(f'stats:party:{party_name}:ratings_count') or 0)
-        stats.ratings_average = ratings_sum / ratings_count if ratings_count > 0 else 0.0
+        # Only known parties are cached, so names taken from the URL cannot
+        # evict other cache entries
+        if party_name not in PARTIES_BY_NAME:
+            return load()
+        return self._get_or_load(('party', party_name), load)
+    
+    @staticmethod
+    def _build_governorate_stats(governorate: Dict[str, str], values: Sequence[Optional[str]]) -> GovernorateStats:
+        """
+        Build governorate statistics from raw Redis counter values.
         
-        return stats
+        Args:
+            governorate (Dict[str, str]): The governorate reference data.
+            values (Sequence[Optional[str]]): The users, complaints and messages
+                counters, in the order returned by ``_governorate_keys``.
+        
+        Returns:
+            GovernorateStats: The governorate statistics.
+        """
+        users, complaints, messages = values
+        return GovernorateStats(
+            governorate_code=governorate['code'],
+            governorate_name=governorate['name'],
+            users_count=int(users or 0),
+            complaints_count=int(complaints or 0),
+            messages_count=int(messages or 0)
+        )
+    
+    @staticmethod
+    def _build_party_stats(party_name: str, values: Sequence[Optional[str]]) -> PartyStats:
+        """
+        Build party statistics from raw Redis counter values.
+        
+        Args:
+            party_name (str): The name of the political party.
+            values (Sequence[Optional[str]]): The party counters, in the order
+                returned by ``_party_keys``.
+        
+        Returns:
+            PartyStats: The party statistics.
+        """
+        candidates, members, ratings_sum, ratings_count = values
+        ratings_sum = float(ratings_sum or 0)
+        ratings_count = int(ratings_count or 0)
+        
+        return PartyStats(
+            party_name=party_name,
+            candidates_count=int(candidates or 0),
+            members_count=int(members or 0),
+            # Rounded once here so callers can use it as-is
+            ratings_average=round(ratings_sum / ratings_count, 2) if ratings_count > 0 else 0.0
+        )
     
     def increment_counter(self, key: str, amount: int = 1):
         """
@@ -350,6 +528,26 @@ class StatisticsService:
             amount (int): The amount to increment by (default: 1).
         """
         self.redis_client.incr(key, amount)
+        self.invalidate()
+    
+    def bulk_increment(self, amounts: Dict[str, int]):
+        """
+        Increment several related counters atomically in Redis.
+        
+        A single event usually touches more than one counter (a new complaint
+        updates the overall, pending and governorate counters); applying them
+        in one server-side script costs one round-trip and leaves no window in
+        which only some of the counters have been updated.
+        
+        Args:
+            amounts (Dict[str, int]): Mapping of Redis counter keys to the
+                amount each one is incremented by.
+        """
+        if not amounts:
+            return
+        
+        self._bulk_increment_script(keys=list(amounts), args=list(amounts.values()))
+        self.invalidate()
     
     def set_counter(self, key: str, value: int):
         """
@@ -363,6 +561,7 @@ class StatisticsService:
             value (int): The value to set for the counter.
         """
         self.redis_client.set(key, value)
+        self.invalidate()
     
     def get_all_governorate_statistics(self) -> List[GovernorateStats]:
         """
@@ -374,18 +573,18 @@ class StatisticsService:
         Returns:
             List[GovernorateStats]: Statistics for all governorates.
         """
-        from constants import GOVERNORATES
-        
-        all_stats = []
-        for governorate in GOVERNORATES:
-            try:
-                stats = self.get_governorate_statistics(governorate['code'])
-                all_stats.append(stats)
-            except ValueError:
-                # Skip governorates with no data
-                continue
+        # Return a copy so callers can reorder it without touching the cache
+        return list(self._get_or_load(('governorates',), self._fetch_all_governorate_statistics))
+    
+    def _fetch_all_governorate_statistics(self) -> List[GovernorateStats]:
+        """Read the counters of every governorate from Redis."""
+        # Fetch the counters of every governorate in a single round-trip
+        values = self.redis_client.mget(_ALL_GOVERNORATE_KEYS)
         
-        return all_stats
+        return [
+            self._build_governorate_stats(governorate, values[index * 3:index * 3 + 3])
+            for index, governorate in enumerate(GOVERNORATES)
+        ]
     
     def get_top_parties_by_representation(self, limit: int = 10) -> List[PartyStats]:
         """
@@ -397,20 +596,20 @@ class StatisticsService:
         Returns:
             List[PartyStats]: Top parties sorted by total representation.
         """
-        from constants import POLITICAL_PARTIES
+        # Fetch the counters of every party in a single round-trip
+        values = self.redis_client.mget(_ALL_PARTY_KEYS)
         
-        party_stats = []
-        for party in POLITICAL_PARTIES:
-            try:
-                stats = self.get_party_statistics(party['name'])
-                party_stats.append(stats)
-            except Exception:
-                # Skip parties with no data
-                continue
+        # Rank on raw candidate + member counts and only build stats for the top parties
+        totals = [
+            int(values[index * 4] or 0) + int(values[index * 4 + 1] or 0)
+            for index in range(len(POLITICAL_PARTIES))
+        ]
+        top_indexes = heapq.nlargest(limit, range(len(POLITICAL_PARTIES)), key=totals.__getitem__)
         
-        # Sort by total representation and return top parties
-        party_stats.sort(key=lambda x: x.get_total_representation(), reverse=True)
-        return party_stats[:limit]
+        return [
+            self._build_party_stats(POLITICAL_PARTIES[index]['name'], values[index * 4:index * 4 + 4])
+            for index in top_indexes
+        ]
     
     def initialize_default_data(self):
         """
@@ -428,20 +627,26 @@ class StatisticsService:
         """
         # Set default values for testing
         default_values = {
-            'stats:total_users': 1500,
-            'stats:total_citizens': 1200,
-            'stats:total_candidates': 200,
-            'stats:total_members': 100,
-            'stats:total_messages': 5000,
-            'stats:total_complaints': 800,
-            'stats:total_ratings': 2500,
-            'stats:resolved_complaints': 600,
-            'stats:pending_complaints': 200
+            REDIS_KEY.TOTAL_USERS: 1500,
+            REDIS_KEY.TOTAL_CITIZENS: 1200,
+            REDIS_KEY.TOTAL_CANDIDATES: 200,
+            REDIS_KEY.TOTAL_MEMBERS: 100,
+            REDIS_KEY.TOTAL_MESSAGES: 5000,
+            REDIS_KEY.TOTAL_COMPLAINTS: 800,
+            REDIS_KEY.TOTAL_RATINGS: 2500,
+            REDIS_KEY.RESOLVED_COMPLAINTS: 600,
+            REDIS_KEY.PENDING_COMPLAINTS: 200
         }
         
+        # Only seed missing keys, all in a single round-trip; MSETNX is not used
+        # because it refuses to write anything once a single key already exists
+        pipe = self.redis_client.pipeline(transaction=False)
         for key, value in default_values.items():
-            if not self.redis_client.exists(key):
-                self.redis_client.set(key, value)
+            pipe.set(key, value, nx=True)
+        
+        # Keep the cached statistics when every counter was already seeded
+        if any(pipe.execute()):
+            self.invalidate()
     
     def reset_all_statistics(self):
         """
@@ -450,11 +655,9 @@ class StatisticsService:
         This method is useful for testing or when starting fresh data collection.
         Use with caution as this operation cannot be undone.
         """
-        keys_to_reset = [
-            'stats:total_users', 'stats:total_citizens', 'stats:total_candidates',
-            'stats:total_members', 'stats:total_messages', 'stats:total_complaints',
-            'stats:total_ratings', 'stats:resolved_complaints', 'stats:pending_complaints'
-        ]
-        
-        for key in keys_to_reset:
-            self.redis_client.set(key, 0)
+        # Zero the overall counters plus every governorate and party counter
+        # that exists, without maintaining a list of them here
+        keys = set(OVERALL_KEYS)
+        keys.update(self.redis_client.scan_iter(match=STATS_KEY_PATTERN, count=1000))
+        self.redis_client.mset(dict.fromkeys(keys, 0))
+        self.invalidate()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Background Tasks - Naebak Statistics Service
+
+This module runs long-running maintenance operations, such as seeding default
+data, outside the request cycle. Task status is kept in Redis so that any
+worker process can report on a task started by another one.
+"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+import redis
+
+
+class TaskRunner:
+    """
+    Runs callables in a background executor and tracks their status in Redis.
+    
+    Under gunicorn's gevent workers the executor threads are monkey-patched into
+    greenlets, so submitted tasks yield on Redis I/O like any request would.
+    
+    Attributes:
+        redis_client: Redis client used to store task status.
+    
+    Task Status Values:
+        - queued: The task is waiting for a free executor slot
+        - running: The task is currently executing
+        - completed: The task finished successfully
+        - failed: The task raised an exception (see the ``error`` field)
+    """
+    
+    KEY_PREFIX = 'task'
+    STATUS_TTL = 3600
+    
+    def __init__(self, redis_client, max_workers: int = 1):
+        """
+        Initialize the task runner.
+        
+        Args:
+            redis_client: Redis client used to store task status.
+            max_workers (int): Maximum number of tasks running at once (default: 1).
+        """
+        self.redis_client = redis_client
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def submit(self, name: str, func: Callable[[], None]) -> str:
+        """
+        Queue a callable for background execution.
+        
+        Args:
+            name (str): The task name, used to namespace its status key.
+            func (Callable[[], None]): The callable to run.
+        
+        Returns:
+            str: The identifier of the queued task.
+        """
+        task_id = uuid.uuid4().hex
+        self._set_status(name, task_id, status='queued')
+        self._executor.submit(self._run, name, task_id, func)
+        return task_id
+    
+    def get_status(self, name: str, task_id: str) -> Optional[Dict[str, str]]:
+        """
+        Retrieve the status of a task.
+        
+        Args:
+            name (str): The task name.
+            task_id (str): The task identifier returned by ``submit``.
+        
+        Returns:
+            Optional[Dict[str, str]]: The task status fields, or None if the
+            task is unknown or its status has expired.
+        """
+        return self.redis_client.hgetall(self._make_key(name, task_id)) or None
+    
+    def _run(self, name: str, task_id: str, func: Callable[[], None]):
+        """Execute a task and record its outcome."""
+        try:
+            self._set_status(name, task_id, status='running')
+            func()
+        except Exception as e:
+            try:
+                self._set_status(name, task_id, status='failed', error=str(e))
+            except redis.RedisError:
+                pass
+        else:
+            self._set_status(name, task_id, status='completed')
+    
+    def _set_status(self, name: str, task_id: str, **fields: str):
+        """Store task status fields with an expiry."""
+        key = self._make_key(name, task_id)
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hset(key, mapping=fields)
+        pipe.expire(key, self.STATUS_TTL)
+        pipe.execute()
+    
+    def _make_key(self, name: str, task_id: str) -> str:
+        """Build the Redis key holding a task's status."""
+        return f'{self.KEY_PREFIX}:{name}:{task_id}'
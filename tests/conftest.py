@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Shared test fixtures for the Naebak Statistics Service.
+
+Every test runs against an isolated in-memory fakeredis server, so the suite
+needs no running Redis instance.
+"""
+
+import fakeredis
+import pytest
+
+import app as app_module
+import models
+from models import StatisticsService
+from tasks import TaskRunner
+
+
+@pytest.fixture
+def fake_redis():
+    """Provide a fresh in-memory Redis client with decoded responses."""
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
+@pytest.fixture
+def stats_service(monkeypatch, fake_redis):
+    """Provide a StatisticsService bound to the fake Redis client."""
+    monkeypatch.setattr(models, 'redis_client', fake_redis)
+    return StatisticsService()
+
+
+@pytest.fixture
+def client(monkeypatch, fake_redis, stats_service):
+    """Provide a Flask test client whose services all use the fake Redis client."""
+    monkeypatch.setattr(app_module, 'stats_service', stats_service)
+    monkeypatch.setattr(app_module, 'task_runner', TaskRunner(fake_redis))
+    # The response cache is bound to the views by its decorator, so patch it in place
+    monkeypatch.setattr(app_module.response_cache, 'redis_client', fake_redis)
+    monkeypatch.setattr(app_module.response_cache, '_last_known', {})
+    monkeypatch.setitem(app_module.app.config, 'TESTING', True)
+    return app_module.app.test_client()
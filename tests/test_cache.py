@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Tests for the Redis-backed ResponseCache used by the statistics endpoints."""
+
+import pytest
+
+import app as app_module
+from constants import REDIS_KEY
+
+OVERALL_URL = '/api/statistics/overall/'
+TOP_PARTIES_URL = '/api/statistics/parties/top/'
+
+
+def _cache_keys(fake_redis):
+    return sorted(fake_redis.keys('cache:resp:*'))
+
+
+def test_miss_stores_response_and_hit_serves_it(client, fake_redis, stats_service):
+    fake_redis.set(REDIS_KEY.TOTAL_USERS, 10)
+    first = client.get(OVERALL_URL)
+    
+    # A change in Redis is not visible until the cached response expires
+    fake_redis.set(REDIS_KEY.TOTAL_USERS, 20)
+    stats_service.invalidate()
+    second = client.get(OVERALL_URL)
+    
+    assert first.json['total_users'] == 10
+    assert second.json['total_users'] == 10
+    assert _cache_keys(fake_redis) == ['cache:resp:get_overall_statistics']
+    assert 0 < fake_redis.ttl('cache:resp:get_overall_statistics') <= app_module.response_cache.ttl
+
+
+def test_expired_entry_is_regenerated(client, fake_redis, stats_service):
+    fake_redis.set(REDIS_KEY.TOTAL_USERS, 10)
+    client.get(OVERALL_URL)
+    
+    fake_redis.delete('cache:resp:get_overall_statistics')
+    fake_redis.set(REDIS_KEY.TOTAL_USERS, 20)
+    stats_service.invalidate()
+    
+    assert client.get(OVERALL_URL).json['total_users'] == 20
+
+
+def test_unrelated_query_parameters_share_one_entry(client, fake_redis):
+    client.get(OVERALL_URL)
+    client.get(OVERALL_URL + '?_=1')
+    client.get(OVERALL_URL + '?_=2')
+    
+    assert _cache_keys(fake_redis) == ['cache:resp:get_overall_statistics']
+
+
+@pytest.mark.parametrize('query, limit', [
+    ('', 10),
+    ('?limit=10', 10),
+    ('?limit=abc', 10),
+    ('?limit=0', 1),
+    ('?limit=999', 50),
+    ('?limit=3&_=123', 3),
+])
+def test_vary_on_keys_on_normalized_limit(client, fake_redis, query, limit):
+    response = client.get(TOP_PARTIES_URL + query)
+    
+    assert response.status_code == 200
+    assert _cache_keys(fake_redis) == [f'cache:resp:get_top_parties_statistics:limit={limit}']
+
+
+def test_stale_body_is_served_and_logged_when_view_fails(client, fake_redis, monkeypatch, caplog):
+    fake_redis.set(REDIS_KEY.TOTAL_USERS, 10)
+    client.get(OVERALL_URL)
+    fake_redis.delete('cache:resp:get_overall_statistics')
+    
+    def failing_read():
+        raise RuntimeError('redis is down')
+    
+    monkeypatch.setattr(app_module.stats_service, 'get_overall_statistics', failing_read)
+    response = client.get(OVERALL_URL)
+    
+    assert response.status_code == 200
+    assert response.json['total_users'] == 10
+    assert response.headers['X-Cache'] == 'STALE'
+    assert 'Serving stale response for get_overall_statistics' in caplog.text
+    assert 'redis is down' in caplog.text
+
+
+def test_failure_without_stale_body_returns_500(client, monkeypatch):
+    # Let the app's 500 handler render the error instead of re-raising it
+    monkeypatch.setitem(app_module.app.config, 'PROPAGATE_EXCEPTIONS', False)
+    
+    def failing_read():
+        raise RuntimeError('redis is down')
+    
+    monkeypatch.setattr(app_module.stats_service, 'get_overall_statistics', failing_read)
+    response = client.get(OVERALL_URL)
+    
+    assert response.status_code == 500
+    assert response.json == {'error': 'redis is down'}
+    assert 'X-Cache' not in response.headers
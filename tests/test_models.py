@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Tests for the Redis write operations of StatisticsService."""
+
+from constants import OVERALL_KEYS, REDIS_KEY
+
+
+def test_bulk_increment_applies_every_amount(stats_service, fake_redis):
+    fake_redis.set(REDIS_KEY.TOTAL_COMPLAINTS, 10)
+    
+    stats_service.bulk_increment({
+        REDIS_KEY.TOTAL_COMPLAINTS: 1,
+        REDIS_KEY.PENDING_COMPLAINTS: 1,
+        'stats:gov:CAI:complaints': 3
+    })
+    
+    assert fake_redis.mget(
+        REDIS_KEY.TOTAL_COMPLAINTS, REDIS_KEY.PENDING_COMPLAINTS, 'stats:gov:CAI:complaints'
+    ) == ['11', '1', '3']
+
+
+def test_bulk_increment_invalidates_cached_reads(stats_service):
+    assert stats_service.get_overall_statistics().total_users == 0
+    
+    stats_service.bulk_increment({REDIS_KEY.TOTAL_USERS: 5})
+    
+    assert stats_service.get_overall_statistics().total_users == 5
+
+
+def test_bulk_increment_with_no_amounts_is_a_no_op(stats_service, fake_redis):
+    stats_service.bulk_increment({})
+    
+    assert fake_redis.dbsize() == 0
+
+
+def test_reset_all_statistics_zeroes_every_stats_counter(stats_service, fake_redis):
+    stats_service.initialize_default_data()
+    fake_redis.set('stats:gov:CAI:users', 7)
+    fake_redis.set('stats:party:حزب الوفد:members', 4)
+    fake_redis.set('cache:resp:get_overall_statistics', 'body')
+    fake_redis.hset('task:initialize:abc', 'status', 'completed')
+    
+    stats_service.reset_all_statistics()
+    
+    assert set(fake_redis.mget(OVERALL_KEYS)) == {'0'}
+    assert fake_redis.get('stats:gov:CAI:users') == '0'
+    assert fake_redis.get('stats:party:حزب الوفد:members') == '0'
+    assert fake_redis.get('cache:resp:get_overall_statistics') == 'body'
+    assert fake_redis.hget('task:initialize:abc', 'status') == 'completed'
+
+
+def test_reset_all_statistics_creates_overall_counters_on_empty_store(stats_service, fake_redis):
+    stats_service.reset_all_statistics()
+    
+    assert fake_redis.mget(OVERALL_KEYS) == ['0'] * len(OVERALL_KEYS)
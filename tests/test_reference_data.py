@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Tests for ETag and content negotiation on the reference-data endpoints."""
+
+import gzip
+import json
+
+import pytest
+
+import constants
+
+PARTIES_URL = '/api/statistics/data/parties/'
+
+
+def test_identity_body_matches_reference_data(client):
+    response = client.get(PARTIES_URL)
+    
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(response.data) == constants.POLITICAL_PARTIES
+    assert response.headers['Cache-Control'] == 'public, max-age=86400, immutable'
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_gzip_body_is_served_to_gzip_clients(client):
+    response = client.get(PARTIES_URL, headers={'Accept-Encoding': 'gzip'})
+    
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.data)) == constants.POLITICAL_PARTIES
+    assert response.get_etag()[0].endswith(':gzip')
+
+
+@pytest.mark.parametrize('accept_encoding', ['gzip;q=0', 'br;q=1, gzip;q=0', 'br', 'deflate', ''])
+def test_identity_body_is_served_without_gzip(client, accept_encoding):
+    response = client.get(PARTIES_URL, headers={'Accept-Encoding': accept_encoding})
+    
+    assert 'Content-Encoding' not in response.headers
+    assert not response.get_etag()[0].endswith(':gzip')
+    assert json.loads(response.data) == constants.POLITICAL_PARTIES
+
+
+@pytest.mark.parametrize('accept_encoding', ['gzip', 'gzip;q=0', 'br', 'deflate', ''])
+def test_matching_etag_returns_304(client, accept_encoding):
+    headers = {'Accept-Encoding': accept_encoding}
+    etag = client.get(PARTIES_URL, headers=headers).headers['ETag']
+    
+    response = client.get(PARTIES_URL, headers={**headers, 'If-None-Match': etag})
+    
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+
+def test_etag_of_other_encoding_does_not_match(client):
+    gzip_etag = client.get(PARTIES_URL, headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+    
+    response = client.get(PARTIES_URL, headers={'If-None-Match': gzip_etag})
+    
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('accept_encoding, expected', [
+    ('gzip', 'gzip'),
+    ('gzip;q=0', None),
+    ('gzip;q=0, br', 'br'),
+    ('br;q=0, gzip', 'gzip'),
+])
+def test_dynamic_endpoints_honour_encoding_quality(client, stats_service, accept_encoding, expected):
+    stats_service.initialize_default_data()
+    
+    response = client.get('/api/statistics/governorates/all/', headers={'Accept-Encoding': accept_encoding})
+    
+    assert response.headers.get('Content-Encoding') == expected
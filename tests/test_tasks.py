@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Tests for the background TaskRunner."""
+
+import threading
+
+import pytest
+
+from tasks import TaskRunner
+
+
+@pytest.fixture
+def runner(fake_redis):
+    """Provide a single-worker TaskRunner and shut it down after the test."""
+    task_runner = TaskRunner(fake_redis)
+    yield task_runner
+    task_runner._executor.shutdown(wait=True)
+
+
+def test_task_moves_from_queued_to_running_to_completed(runner):
+    started = threading.Event()
+    release = threading.Event()
+    
+    def blocking_task():
+        started.set()
+        release.wait(timeout=5)
+    
+    first_id = runner.submit('initialize', blocking_task)
+    assert started.wait(timeout=5)
+    # The single executor slot is busy, so the next task stays queued
+    second_id = runner.submit('initialize', lambda: None)
+    
+    assert runner.get_status('initialize', first_id) == {'status': 'running'}
+    assert runner.get_status('initialize', second_id) == {'status': 'queued'}
+    
+    release.set()
+    runner._executor.shutdown(wait=True)
+    
+    assert runner.get_status('initialize', first_id) == {'status': 'completed'}
+    assert runner.get_status('initialize', second_id) == {'status': 'completed'}
+
+
+def test_failed_task_records_error(runner):
+    def failing_task():
+        raise RuntimeError('seeding failed')
+    
+    task_id = runner.submit('initialize', failing_task)
+    runner._executor.shutdown(wait=True)
+    
+    assert runner.get_status('initialize', task_id) == {
+        'status': 'failed',
+        'error': 'seeding failed'
+    }
+
+
+def test_status_is_stored_with_expiry(runner, fake_redis):
+    task_id = runner.submit('initialize', lambda: None)
+    runner._executor.shutdown(wait=True)
+    
+    assert 0 < fake_redis.ttl(f'task:initialize:{task_id}') <= TaskRunner.STATUS_TTL
+
+
+def test_unknown_task_has_no_status(runner):
+    assert runner.get_status('initialize', 'missing') is None